@@ -2,141 +2,114 @@
 """Generate a static index2.html from soundon.xml and apple.json."""
 from __future__ import annotations
 
+import functools
+import hashlib
+import itertools
 import json
 import re
+import sys
 import textwrap
-from dataclasses import dataclass
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from html import escape as html_escape
-from html.parser import HTMLParser
+from html import unescape as html_unescape
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, NamedTuple
 from zoneinfo import ZoneInfo
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml is optional
+    import xml.etree.ElementTree as ET  # type: ignore[no-redef]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None  # type: ignore[assignment]
 
 ROOT = Path(__file__).resolve().parent.parent
 RSS_PATH = ROOT / "soundon.xml"
 APPLE_PATH = ROOT / "apple.json"
 TEMPLATE_PATH = ROOT / "index_template.html"
 OUTPUT_PATH = ROOT / "index.html"
+STATIC_SCRIPT_PATH = Path(__file__).with_name("tag_search.js")
+CACHE_PATH = ROOT / ".cache" / "generate_index.json"
 
 ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
 CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
 
 
-class HTMLSanitizer(HTMLParser):
-    """A minimal HTML sanitizer replicating the client-side rules."""
-
-    FORBIDDEN_TAGS = {"script", "style", "iframe", "object", "embed", "link"}
-
-    def __init__(self) -> None:
-        super().__init__(convert_charrefs=True)
-        self._parts: List[str] = []
-        self._skip_stack: List[str] = []
-
-    def handle_starttag(self, tag: str, attrs: List[tuple[str, str | None]]) -> None:  # type: ignore[override]
-        if self._skip_stack:
-            if tag in self.FORBIDDEN_TAGS:
-                self._skip_stack.append(tag)
-            return
-        if tag in self.FORBIDDEN_TAGS:
-            self._skip_stack.append(tag)
-            return
-        safe_attrs = []
-        for name, value in attrs:
-            if value is None:
-                continue
-            lower_name = name.lower()
-            if lower_name.startswith("on"):
-                continue
-            if lower_name in {"href", "src"} and value.lower().startswith("javascript:"):
-                continue
-            if lower_name == "style":
-                continue
-            safe_attrs.append((name, value))
-        attr_text = "".join(
-            f" {name}=\"{html_escape(value, quote=True)}\"" for name, value in safe_attrs
-        )
-        self._parts.append(f"<{tag}{attr_text}>")
-
-    def handle_endtag(self, tag: str) -> None:  # type: ignore[override]
-        if self._skip_stack:
-            if tag == self._skip_stack[-1]:
-                self._skip_stack.pop()
-            return
-        if tag in self.FORBIDDEN_TAGS:
-            return
-        self._parts.append(f"</{tag}>")
-
-    def handle_startendtag(self, tag: str, attrs: List[tuple[str, str | None]]) -> None:  # type: ignore[override]
-        if self._skip_stack or tag in self.FORBIDDEN_TAGS:
-            return
-        safe_attrs = []
-        for name, value in attrs:
-            if value is None:
-                continue
-            lower_name = name.lower()
-            if lower_name.startswith("on"):
-                continue
-            if lower_name in {"href", "src"} and value.lower().startswith("javascript:"):
-                continue
-            if lower_name == "style":
-                continue
-            safe_attrs.append((name, value))
-        attr_text = "".join(
-            f" {name}=\"{html_escape(value, quote=True)}\"" for name, value in safe_attrs
-        )
-        self._parts.append(f"<{tag}{attr_text}/>")
-
-    def handle_data(self, data: str) -> None:  # type: ignore[override]
-        if self._skip_stack:
-            return
-        if data:
-            self._parts.append(html_escape(data))
+# Sanitization rules replicating the client-side behaviour: forbidden tags
+# are dropped with their content, event handlers / javascript: URLs / style
+# attributes are stripped, comments vanish, and text is re-escaped.
+FORBIDDEN_TAGS = frozenset({"script", "style", "iframe", "object", "embed", "link"})
 
-    def handle_entityref(self, name: str) -> None:  # type: ignore[override]
-        if self._skip_stack:
-            return
-        self._parts.append(f"&{name};")
+_TAG_RE = re.compile(r"<!--.*?-->|<(/?)([a-zA-Z][a-zA-Z0-9]*)([^>]*?)(/?)>", re.DOTALL)
+_ATTR_RE = re.compile(r'([a-zA-Z_:][-a-zA-Z0-9_:.]*)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))')
 
-    def handle_charref(self, name: str) -> None:  # type: ignore[override]
-        if self._skip_stack:
-            return
-        self._parts.append(f"&#{name};")
+_URL_ATTRS = frozenset({"href", "src"})
 
-    def handle_comment(self, data: str) -> None:  # type: ignore[override]
-        # Drop comments to match template sanitization intent.
-        return
 
-    def get_html(self) -> str:
-        return "".join(self._parts).strip()
+def _render_attrs(attr_text: str) -> str:
+    parts: List[str] = []
+    for match in _ATTR_RE.finditer(attr_text):
+        lower_name = match.group(1).lower()
+        if lower_name.startswith("on") or lower_name == "style":
+            continue
+        value = html_unescape(match.group(2) or match.group(3) or match.group(4) or "")
+        if lower_name in _URL_ATTRS and value.lower().startswith("javascript:"):
+            continue
+        parts.append(f" {lower_name}=\"{html_escape(value, quote=True)}\"")
+    return "".join(parts)
 
 
 def sanitize_html(value: str | None) -> str:
     if not value:
         return ""
-    sanitizer = HTMLSanitizer()
-    sanitizer.feed(value)
-    sanitizer.close()
-    return sanitizer.get_html()
+    parts: List[str] = []
+    skip_stack: List[str] = []
+    pos = 0
+    for match in _TAG_RE.finditer(value):
+        if match.start() > pos and not skip_stack:
+            parts.append(html_escape(html_unescape(value[pos:match.start()])))
+        pos = match.end()
+        if match.group(2) is None:
+            continue  # comment
+        closing, tag, attr_text, self_closing = match.groups()
+        tag = tag.lower()
+        if closing:
+            if skip_stack:
+                if tag == skip_stack[-1]:
+                    skip_stack.pop()
+            elif tag not in FORBIDDEN_TAGS:
+                parts.append(f"</{tag}>")
+        elif skip_stack or tag in FORBIDDEN_TAGS:
+            if tag in FORBIDDEN_TAGS and not self_closing:
+                skip_stack.append(tag)
+        elif self_closing:
+            parts.append(f"<{tag}{_render_attrs(attr_text)}/>")
+        else:
+            parts.append(f"<{tag}{_render_attrs(attr_text)}>")
+    if pos < len(value) and not skip_stack:
+        parts.append(html_escape(html_unescape(value[pos:])))
+    return "".join(parts).strip()
+
+
+_KEYWORDS_SPLIT_RE = re.compile(r"[,，]")
 
 
 def parse_keywords(value: str | None) -> List[str]:
     if not value:
         return []
-    seen = set()
-    keywords: List[str] = []
-    for raw in re.split(r"[,，]", value):
-        keyword = raw.strip()
-        if not keyword or keyword in seen:
-            continue
-        seen.add(keyword)
-        keywords.append(keyword)
-    return keywords
+    parts = (part.strip() for part in _KEYWORDS_SPLIT_RE.split(value))
+    # dict.fromkeys dedupes in C while keeping first-seen order.
+    return list(dict.fromkeys(part for part in parts if part))
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_guid(value: str | None) -> str:
+    # Each GUID passes through here twice (Apple map + RSS item), and in
+    # watch mode the same feed is normalized run after run.
     return value.strip().lower() if value else ""
 
 
@@ -152,8 +125,10 @@ WEEKDAY_MAP = {
 
 
 TAIPEI_TZ = ZoneInfo("Asia/Taipei")
+UTC_TZ = ZoneInfo("UTC")
 
 
+@functools.lru_cache(maxsize=2048)
 def format_date(value: str | None) -> str:
     if not value:
         return ""
@@ -164,7 +139,7 @@ def format_date(value: str | None) -> str:
     if dt is None:
         return value
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=ZoneInfo("UTC"))
+        dt = dt.replace(tzinfo=UTC_TZ)
     dt = dt.astimezone(TAIPEI_TZ)
     weekday = WEEKDAY_MAP.get(dt.weekday())
     if not weekday:
@@ -172,16 +147,25 @@ def format_date(value: str | None) -> str:
     return f"{dt.year}年{dt.month}月{dt.day}日 {weekday}"
 
 
+_HMS_RE = re.compile(r"^\s*(\d+):(\d+):(\d+)\s*$")
+_INT_RE = re.compile(r"^\s*(\d+)\s*$")
+
+
 def format_duration(value: str | None) -> str:
     if not value:
         return ""
-    raw = value.strip()
-    if not raw:
-        return ""
-    total_seconds = 0
-    if raw.isdigit():
-        total_seconds = int(raw)
+    # Fast path: feeds almost always publish "HH:MM:SS" or bare seconds.
+    match = _HMS_RE.match(value)
+    if match:
+        hours, minutes, secs = map(int, match.groups())
+        total_seconds = hours * 3600 + minutes * 60 + secs
+    elif match := _INT_RE.match(value):
+        total_seconds = int(match.group(1))
     else:
+        raw = value.strip()
+        if not raw:
+            return ""
+        total_seconds = 0
         parts = [part.strip() for part in raw.split(":")]
         ints = []
         for part in parts:
@@ -208,8 +192,7 @@ def format_duration(value: str | None) -> str:
     return " ".join(segments)
 
 
-@dataclass
-class Episode:
+class Episode(NamedTuple):
     title: str
     pub_date: str
     duration: str
@@ -226,6 +209,8 @@ def indent_lines(content: Iterable[str], indent: str) -> List[str]:
 
 
 def render_description(description_html: str, summary: str, indent: str) -> List[str]:
+    if not description_html and not summary:
+        return []
     lines: List[str] = [f"{indent}<div class=\"episode-description\">"]
     inner_indent = indent + "  "
     if description_html:
@@ -236,116 +221,267 @@ def render_description(description_html: str, summary: str, indent: str) -> List
     return lines
 
 
-def render_episode_card(episode: Episode, base_indent: str = "          ") -> str:
-    lines: List[str] = []
+@functools.lru_cache(maxsize=4096)
+def _escape_cached(value: str, quote: bool = True) -> str:
+    """html_escape with memoization for strings that repeat across cards."""
+    return html_escape(value, quote)
+
+
+_BASE_INDENT = "          "
+
+
+class _CardFragments(NamedTuple):
+    """Markup pieces of an episode card that are constant per indent level."""
+
+    level1: str
+    level2: str
+    article_open: str
+    article_close: str
+    cover_open: str
+    div_close: str
+    meta_open: str
+    h3_open: str
+    actions_open: str
+    icon_line: str
+    link_close: str
+    keywords_open: str
+
+
+@functools.lru_cache(maxsize=4)
+def _card_fragments(base_indent: str) -> _CardFragments:
     level1 = base_indent + "  "
     level2 = level1 + "  "
-    dataset_title = html_escape(episode.title, quote=True)
-    keywords_json = html_escape(json.dumps(episode.keywords, ensure_ascii=False), quote=True)
-    lines.append(
-        f"{base_indent}<article class=\"episode-card\" data-title=\"{dataset_title}\" data-keywords=\"{keywords_json}\">"
+    return _CardFragments(
+        level1=level1,
+        level2=level2,
+        article_open=f"{base_indent}<article class=\"episode-card\" data-title=\"",
+        article_close=f"{base_indent}</article>",
+        cover_open=f"{level1}<div class=\"episode-cover\">",
+        div_close=f"{level1}</div>",
+        meta_open=f"{level1}<div class=\"episode-meta\">",
+        h3_open=f"{level1}<h3 class=\"episode-title\">",
+        actions_open=f"{level1}<div class=\"episode-actions\">",
+        icon_line=f"{level2}  <span class=\"icon\" aria-hidden=\"true\">▶️</span>",
+        link_close=f"{level2}</a>",
+        keywords_open=f"{level1}<div class=\"episode-keywords\">關鍵字：",
     )
+
+
+def render_episode_card(episode: Episode, lines: List[str], base_indent: str = _BASE_INDENT) -> None:
+    """Append the card markup for ``episode`` to the shared ``lines`` buffer."""
+    frag = _card_fragments(base_indent)
+    level2 = frag.level2
+    title_esc = _escape_cached(episode.title)
+    keywords_json = html_escape(json.dumps(episode.keywords, ensure_ascii=False), quote=True)
+    lines.append(f"{frag.article_open}{title_esc}\" data-keywords=\"{keywords_json}\">")
     if episode.cover:
-        lines.append(f"{level1}<div class=\"episode-cover\">")
-        alt_text = html_escape(f"{episode.title} 封面", quote=True)
-        cover_src = html_escape(episode.cover, quote=True)
+        lines.append(frag.cover_open)
+        alt_text = _escape_cached(f"{episode.title} 封面")
+        cover_src = _escape_cached(episode.cover)
         lines.append(f"{level2}<img src=\"{cover_src}\" alt=\"{alt_text}\" />")
-        lines.append(f"{level1}</div>")
+        lines.append(frag.div_close)
     meta_segments: List[str] = []
     if episode.pub_date:
-        meta_segments.append(f"{level2}<span>{html_escape(episode.pub_date)}</span>")
+        meta_segments.append(f"{level2}<span>{_escape_cached(episode.pub_date)}</span>")
     if episode.duration:
-        meta_segments.append(f"{level2}<span>節目長度：{html_escape(episode.duration)}</span>")
+        meta_segments.append(f"{level2}<span>節目長度：{_escape_cached(episode.duration)}</span>")
     if meta_segments:
-        lines.append(f"{level1}<div class=\"episode-meta\">")
+        lines.append(frag.meta_open)
         lines.extend(meta_segments)
-        lines.append(f"{level1}</div>")
-    lines.append(f"{level1}<h3 class=\"episode-title\">{html_escape(episode.title)}</h3>")
-    lines.extend(render_description(episode.description_html, episode.summary, level1))
+        lines.append(frag.div_close)
+    lines.append(f"{frag.h3_open}{title_esc}</h3>")
+    description_lines = render_description(episode.description_html, episode.summary, frag.level1)
+    if description_lines:
+        lines.extend(description_lines)
     if episode.apple_link:
-        link_href = html_escape(episode.apple_link, quote=True)
-        aria_label = html_escape(f"在 Apple Podcasts 播放〈{episode.title}〉", quote=True)
-        lines.append(f"{level1}<div class=\"episode-actions\">")
+        link_href = _escape_cached(episode.apple_link)
+        aria_label = _escape_cached(f"在 Apple Podcasts 播放〈{episode.title}〉")
+        lines.append(frag.actions_open)
         lines.append(
             f"{level2}<a class=\"episode-action\" href=\"{link_href}\" target=\"_blank\" rel=\"noopener noreferrer\" aria-label=\"{aria_label}\">"
         )
-        lines.append(f"{level2}  <span class=\"icon\" aria-hidden=\"true\">▶️</span>")
-        sr_text = html_escape(f"在 Apple Podcasts 播放〈{episode.title}〉")
-        lines.append(f"{level2}  <span class=\"sr-only\">{sr_text}</span>")
-        lines.append(f"{level2}</a>")
-        lines.append(f"{level1}</div>")
+        lines.append(frag.icon_line)
+        lines.append(f"{level2}  <span class=\"sr-only\">{aria_label}</span>")
+        lines.append(frag.link_close)
+        lines.append(frag.div_close)
     if episode.keywords:
         keyword_text = html_escape("、".join(episode.keywords))
-        lines.append(f"{level1}<div class=\"episode-keywords\">關鍵字：{keyword_text}</div>")
-    lines.append(f"{base_indent}</article>")
-    return "\n".join(lines)
+        lines.append(f"{frag.keywords_open}{keyword_text}</div>")
+    lines.append(frag.article_close)
 
 
-def load_template() -> str:
+@functools.lru_cache(maxsize=1)
+def _load_template_cached(mtime_ns: int) -> str:
     return TEMPLATE_PATH.read_text(encoding="utf-8")
 
 
-def main() -> None:
+def load_template() -> str:
+    # Keyed on the file's mtime so repeated runs in one process (e.g. a
+    # watcher loop) skip the disk read until the template actually changes.
+    return _load_template_cached(TEMPLATE_PATH.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def load_static_script() -> str:
+    """Read the client-side tag-search script, indented for the template."""
+    script = STATIC_SCRIPT_PATH.read_text(encoding="utf-8")
+    return textwrap.indent(script.strip("\n"), "      ")
+
+
+def _inputs_digest() -> str:
+    """Hash every input that feeds the generated page."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in (RSS_PATH, APPLE_PATH, TEMPLATE_PATH, STATIC_SCRIPT_PATH):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_build_cache() -> dict[str, object]:
+    try:
+        cached = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
+
+def _store_build_cache(digest: str) -> None:
+    CACHE_PATH.parent.mkdir(exist_ok=True)
+    CACHE_PATH.write_text(
+        json.dumps({"digest": digest, "output_mtime_ns": OUTPUT_PATH.stat().st_mtime_ns}),
+        encoding="utf-8",
+    )
+
+
+# Substitution points that vary in shape, combined into one alternation so
+# the template is rewritten in a single scan.  Each alternative carries a
+# named outer group that main()'s dispatch function switches on.
+_TEMPLATE_RE = re.compile(
+    r'(?P<desc><p id="show-description">.*?</p>)'
+    r'|(?P<author><div class="host-info" id="show-author">.*?</div>)'
+    r'|(?P<footer>(?P<footer_head><footer[\s\S]*?<a href=")(?P<footer_href>[^"]*)(?P<footer_tail>"[^>]*>))'
+    r'|(?P<structured><script type="application/ld\+json" id="structured-data">.*?</script>)'
+    r'|(?P<episodes>(?P<episodes_open><div id="episodes"[^>]*>).*?\n        </div>)'
+    r'|(?P<tagsearch><div class="tag-search" id="tag-search" hidden>)',
+    re.DOTALL,
+)
+
+# Fixed placeholders swapped with plain str.replace — the exact strings are
+# under our control in index_template.html, so no regex scan is needed.
+_BRAND_PLACEHOLDER = '<a class="brand" href="#top">科學好好聽</a>'
+_H1_PLACEHOLDER = '<h1 id="show-title">科學好好聽</h1>'
+_COVER_PLACEHOLDER = '<img id="show-cover" alt="科學好好聽節目封面" />'
+_COPYRIGHT_PLACEHOLDER = '© <span id="copyright-year"></span>'
+_STATIC_SCRIPT_MARKER = '<!-- STATIC_SCRIPT -->'
+
+
+def main(force: bool = False) -> None:
+    # The fastest build is the one we skip: if no input changed since the
+    # last run and the output is still the file we wrote, return early.
+    digest = _inputs_digest()
+    if not force and OUTPUT_PATH.exists():
+        cached = _load_build_cache()
+        if (
+            cached.get("digest") == digest
+            and cached.get("output_mtime_ns") == OUTPUT_PATH.stat().st_mtime_ns
+        ):
+            return
+
     template_html = load_template()
 
-    rss_tree = ET.parse(RSS_PATH)
-    channel = rss_tree.getroot().find("channel")
-    if channel is None:
+    # Stream the Apple payload entry by entry when ijson is available, so
+    # the full results list never materializes just to be filtered away.
+    with APPLE_PATH.open("rb") as fp:
+        if ijson is not None:
+            apple_results: Iterable[dict] = ijson.items(fp, "results.item")
+        else:
+            apple_results = json.load(fp).get("results", [])
+        apple_episode_map = {
+            normalize_guid(item.get("episodeGuid")): item.get("trackViewUrl", "")
+            for item in apple_results
+            if item.get("episodeGuid") and item.get("trackViewUrl")
+        }
+
+    # Stream the feed with iterparse instead of building the whole DOM:
+    # channel-level metadata is buffered as its elements close, and each
+    # <item> is turned into an Episode and freed immediately.
+    channel_meta: dict[str, str] = {}
+    card_lines: List[str] = []
+    episode_keyword_lists: List[List[str]] = []
+    saw_channel = False
+    in_item = False
+    depth = 0
+    for event, elem in ET.iterparse(str(RSS_PATH), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 2 and elem.tag == "channel":
+                saw_channel = True
+            elif depth == 3 and elem.tag == "item":
+                in_item = True
+            continue
+        if depth == 3 and elem.tag == "item":
+            in_item = False
+            item = elem
+            title = (item.findtext("title") or "未命名集數").strip()
+            pub_date = format_date(item.findtext("pubDate"))
+            duration = format_duration(item.findtext(f"{ITUNES_NS}duration"))
+            raw_description = item.findtext(f"{CONTENT_NS}encoded") or item.findtext("description") or ""
+            sanitized_description = sanitize_html(raw_description)
+            summary = (item.findtext(f"{ITUNES_NS}summary") or "").strip()
+            raw_keywords = item.findtext(f"{ITUNES_NS}keywords") or ""
+            keywords = parse_keywords(raw_keywords)
+            cover_element = item.find(f"{ITUNES_NS}image")
+            cover = ""
+            if cover_element is not None:
+                cover = cover_element.attrib.get("href", "")
+            guid = normalize_guid(item.findtext("guid"))
+            apple_link = apple_episode_map.get(guid, "")
+            # Render straight into the shared buffer so the Episode (and
+            # its sanitized description) can be dropped immediately.
+            render_episode_card(
+                Episode(
+                    title=title,
+                    pub_date=pub_date,
+                    duration=duration,
+                    description_html=sanitized_description,
+                    summary=summary,
+                    keywords=keywords,
+                    cover=cover,
+                    apple_link=apple_link,
+                    guid=guid,
+                ),
+                card_lines,
+            )
+            episode_keyword_lists.append(keywords)
+            elem.clear()
+            if hasattr(elem, "getprevious"):  # lxml: drop already-processed siblings
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        elif depth == 3 and not in_item:
+            if elem.tag in {"title", "description", "link", "language"}:
+                channel_meta.setdefault(elem.tag, elem.text or "")
+            elif elem.tag in {f"{ITUNES_NS}author", f"{ITUNES_NS}summary"}:
+                channel_meta.setdefault(elem.tag, elem.text or "")
+            elif elem.tag == "image":
+                channel_meta.setdefault("image/url", elem.findtext("url") or "")
+            elif elem.tag == f"{ITUNES_NS}image":
+                href = elem.attrib.get("href", "")
+                if href:
+                    channel_meta["itunes-image"] = href
+        depth -= 1
+    if not saw_channel:
         raise RuntimeError("Invalid RSS feed: missing channel element")
+    all_keywords = set(itertools.chain.from_iterable(episode_keyword_lists))
 
-    show_title = (channel.findtext("title") or "").strip() or "科學好好聽"
-    show_description_raw = channel.findtext("description")
+    show_title = (channel_meta.get("title") or "").strip() or "科學好好聽"
+    show_description_raw = channel_meta.get("description")
     show_description_html = sanitize_html(show_description_raw)
-    show_author = (channel.findtext(f"{ITUNES_NS}author") or "").strip()
-    show_image = channel.findtext("image/url") or ""
-    itunes_image = channel.find(f"{ITUNES_NS}image")
-    if itunes_image is not None:
-        show_image = itunes_image.attrib.get("href", show_image)
-    show_link = (channel.findtext("link") or "").strip()
-    language = (channel.findtext("language") or "zh-Hant").strip() or "zh-Hant"
-    summary_text = channel.findtext(f"{ITUNES_NS}summary") or show_description_raw or ""
-
-    with APPLE_PATH.open("r", encoding="utf-8") as fp:
-        apple_payload = json.load(fp)
-    apple_episode_map = {
-        normalize_guid(item.get("episodeGuid")): item.get("trackViewUrl", "")
-        for item in apple_payload.get("results", [])
-        if item.get("episodeGuid") and item.get("trackViewUrl")
-    }
-
-    episodes: List[Episode] = []
-    all_keywords = set()
-    for item in channel.findall("item"):
-        title = (item.findtext("title") or "未命名集數").strip()
-        pub_date = format_date(item.findtext("pubDate"))
-        duration = format_duration(item.findtext(f"{ITUNES_NS}duration"))
-        raw_description = item.findtext(f"{CONTENT_NS}encoded") or item.findtext("description") or ""
-        sanitized_description = sanitize_html(raw_description)
-        summary = (item.findtext(f"{ITUNES_NS}summary") or "").strip()
-        raw_keywords = item.findtext(f"{ITUNES_NS}keywords") or ""
-        keywords = parse_keywords(raw_keywords)
-        cover_element = item.find(f"{ITUNES_NS}image")
-        cover = ""
-        if cover_element is not None:
-            cover = cover_element.attrib.get("href", "")
-        guid = normalize_guid(item.findtext("guid"))
-        apple_link = apple_episode_map.get(guid, "")
-        episodes.append(
-            Episode(
-                title=title,
-                pub_date=pub_date,
-                duration=duration,
-                description_html=sanitized_description,
-                summary=summary,
-                keywords=keywords,
-                cover=cover,
-                apple_link=apple_link,
-                guid=guid,
-            )
-        )
-        all_keywords.update(keywords)
+    show_author = (channel_meta.get(f"{ITUNES_NS}author") or "").strip()
+    show_image = channel_meta.get("itunes-image") or channel_meta.get("image/url") or ""
+    show_link = (channel_meta.get("link") or "").strip()
+    language = (channel_meta.get("language") or "zh-Hant").strip() or "zh-Hant"
+    summary_text = channel_meta.get(f"{ITUNES_NS}summary") or show_description_raw or ""
 
-    episodes_markup = "\n".join(render_episode_card(ep) for ep in episodes)
+    episodes_markup = "\n".join(card_lines)
 
     now_year = datetime.now(TAIPEI_TZ).year
 
@@ -364,24 +500,7 @@ def main() -> None:
         structured_data["potentialAction"] = [{"@type": "ListenAction", "target": [show_link]}]
 
     structured_data_json = json.dumps(structured_data, ensure_ascii=False, indent=2)
-    structured_data_block = "\n".join(
-        f"      {line}" for line in structured_data_json.splitlines()
-    )
-
-    def replace(pattern: str, repl: str, text: str) -> str:
-        return re.sub(pattern, repl, text, count=1, flags=re.DOTALL)
-
-    result = template_html
-    result = replace(
-        r'(<a class="brand" href="#top">)(.*?)(</a>)',
-        rf"\1{html_escape(show_title)}\3",
-        result,
-    )
-    result = replace(
-        r'(<h1 id="show-title">)(.*?)(</h1>)',
-        rf"\1{html_escape(show_title)}\3",
-        result,
-    )
+    structured_data_block = "      " + structured_data_json.replace("\n", "\n      ")
 
     if show_description_html:
         indented_description = "\n".join(
@@ -389,365 +508,53 @@ def main() -> None:
         )
     else:
         indented_description = "          "
-    result = replace(
-        r'(<p id="show-description">)(.*?)(</p>)',
-        f"\\1\n{indented_description}\n        \\3",
-        result,
-    )
 
     author_text = f"主持：{show_author}" if show_author else ""
-    result = replace(
-        r'(<div class="host-info" id="show-author">)(.*?)(</div>)',
-        rf"\1{html_escape(author_text)}\3",
-        result,
-    )
-
     cover_alt = html_escape(f"{show_title} 封面", quote=True)
     cover_src = html_escape(show_image, quote=True)
-    result = replace(
-        r'<img id="show-cover"[^>]*?>',
-        f'<img id="show-cover" src="{cover_src}" alt="{cover_alt}" />',
-        result,
-    )
 
-    if show_link:
-        result = replace(
-            r'(<footer[\s\S]*?<a href=")([^\"]*)("[^>]*>)',
-            rf"\1{html_escape(show_link, quote=True)}\3",
-            result,
-        )
-
-    result = replace(
-        r'©\s*<span id="copyright-year">.*?</span>',
-        f'© {now_year}',
-        result,
+    static_script = load_static_script()
+
+    def render_substitution(match: re.Match[str]) -> str:
+        if match.group("desc") is not None:
+            return f'<p id="show-description">\n{indented_description}\n        </p>'
+        if match.group("author") is not None:
+            return f'<div class="host-info" id="show-author">{html_escape(author_text)}</div>'
+        if match.group("footer") is not None:
+            href = html_escape(show_link, quote=True) if show_link else match.group("footer_href")
+            return f'{match.group("footer_head")}{href}{match.group("footer_tail")}'
+        if match.group("structured") is not None:
+            return (
+                '<script type="application/ld+json" id="structured-data">\n'
+                f'{structured_data_block}\n    </script>'
+            )
+        if match.group("episodes") is not None:
+            open_tag = match.group("episodes_open")
+            if episodes_markup:
+                return f"{open_tag}\n{episodes_markup}\n        \n        </div>"
+            return f"{open_tag}\n        \n        </div>"
+        if all_keywords:
+            return '<div class="tag-search" id="tag-search">'
+        return match.group(0)
+
+    result = _TEMPLATE_RE.sub(render_substitution, template_html)
+    result = result.replace(
+        _BRAND_PLACEHOLDER, f'<a class="brand" href="#top">{html_escape(show_title)}</a>', 1
     )
-
-    result = replace(
-        r'(<script type="application/ld\+json" id="structured-data">)(.*?)(</script>)',
-        f"\\1\n{structured_data_block}\n    \\3",
-        result,
+    result = result.replace(
+        _H1_PLACEHOLDER, f'<h1 id="show-title">{html_escape(show_title)}</h1>', 1
     )
-
-    episodes_replacement = f"\\1\n{episodes_markup}\n        \\3" if episodes_markup else "\\1\\n        \\3"
-    result = replace(
-        r'(<div id="episodes"[^>]*>)(.*?)(\n        </div>)',
-        episodes_replacement,
-        result,
+    result = result.replace(
+        _COVER_PLACEHOLDER, f'<img id="show-cover" src="{cover_src}" alt="{cover_alt}" />', 1
     )
-
-    if all_keywords:
-        result = replace(
-            r'<div class="tag-search" id="tag-search" hidden>',
-            '<div class="tag-search" id="tag-search">',
-            result,
-        )
-
-    static_script = textwrap.dedent("""
-(() => {
-  const episodesContainer = document.getElementById('episodes');
-  const tagSearchWrapper = document.getElementById('tag-search');
-  const selectedTagsContainer = document.getElementById('selected-tags');
-  const tagInput = document.getElementById('tag-input');
-  const suggestionsList = document.getElementById('tag-suggestions');
-  const noResultsEl = document.getElementById('no-results');
-  const episodesData = [];
-  const allKeywordsSet = new Set();
-  const activeTags = [];
-  const activeTagSet = new Set();
-  let highlightedSuggestionIndex = -1;
-  const tagInputDefaultPlaceholder = tagInput?.getAttribute('placeholder') || '';
-  const TAG_INPUT_DISABLED_PLACEHOLDER = '目前沒有可用關鍵字';
-  const TAG_SUGGESTION_LIMIT = 100;
-  let keywordDataReady = false;
-
-  function getAvailableTags() {
-    return Array.from(allKeywordsSet).filter((tag) => !activeTagSet.has(tag));
-  }
-
-  function renderSelectedTags() {
-    if (!selectedTagsContainer) return;
-    selectedTagsContainer.innerHTML = '';
-    activeTags.forEach((tag) => {
-      const chip = document.createElement('button');
-      chip.type = 'button';
-      chip.className = 'tag-chip';
-      chip.setAttribute('data-tag', tag);
-      chip.setAttribute('aria-label', `移除關鍵字 ${tag}`);
-      chip.innerHTML = `<span>${tag}</span><span class="tag-chip-remove" aria-hidden="true">×</span>`;
-      selectedTagsContainer.appendChild(chip);
-    });
-  }
-
-  function filterEpisodes() {
-    if (!episodesContainer) return;
-    const hasActiveTags = activeTags.length > 0;
-    let visibleCount = 0;
-    episodesData.forEach(({ element, keywords }) => {
-      const matches = !hasActiveTags || keywords.some((keyword) => activeTagSet.has(keyword));
-      element.hidden = !matches;
-      if (matches) {
-        visibleCount += 1;
-      }
-    });
-    if (noResultsEl) {
-      if (!hasActiveTags) {
-        noResultsEl.hidden = true;
-      } else {
-        noResultsEl.hidden = visibleCount > 0;
-      }
-    }
-  }
-
-  function setTagInputAvailability(isReady) {
-    if (!tagInput) return;
-    if (isReady) {
-      tagInput.disabled = false;
-      tagInput.removeAttribute('aria-disabled');
-      if (tagInputDefaultPlaceholder) {
-        tagInput.setAttribute('placeholder', tagInputDefaultPlaceholder);
-      } else {
-        tagInput.removeAttribute('placeholder');
-      }
-    } else {
-      tagInput.disabled = true;
-      tagInput.setAttribute('aria-disabled', 'true');
-      tagInput.setAttribute('placeholder', TAG_INPUT_DISABLED_PLACEHOLDER);
-      tagInput.value = '';
-    }
-  }
-
-  function updateSuggestions() {
-    if (!tagInput || !suggestionsList) return;
-    if (!keywordDataReady) {
-      suggestionsList.hidden = true;
-      tagInput.setAttribute('aria-expanded', 'false');
-      highlightedSuggestionIndex = -1;
-      tagInput.removeAttribute('aria-activedescendant');
-      return;
-    }
-    suggestionsList.innerHTML = '';
-    highlightedSuggestionIndex = -1;
-    tagInput.removeAttribute('aria-activedescendant');
-    const availableTags = getAvailableTags();
-    if (!availableTags.length) {
-      suggestionsList.hidden = true;
-      tagInput.setAttribute('aria-expanded', 'false');
-      return;
-    }
-    const query = tagInput.value.trim().toLowerCase();
-    const matches = query
-      ? availableTags.filter((tag) => tag.toLowerCase().includes(query))
-      : availableTags;
-    const limited = matches.slice(0, TAG_SUGGESTION_LIMIT);
-    if (!limited.length || document.activeElement !== tagInput) {
-      suggestionsList.hidden = true;
-      tagInput.setAttribute('aria-expanded', 'false');
-      return;
-    }
-    limited.forEach((tag, index) => {
-      const option = document.createElement('li');
-      option.className = 'tag-suggestion';
-      option.id = `tag-suggestion-${index}`;
-      option.setAttribute('role', 'option');
-      option.textContent = tag;
-      suggestionsList.appendChild(option);
-    });
-    suggestionsList.hidden = false;
-    tagInput.setAttribute('aria-expanded', 'true');
-  }
-
-  function highlightSuggestion(index) {
-    if (!suggestionsList) return;
-    const options = Array.from(suggestionsList.querySelectorAll('.tag-suggestion'));
-    if (!options.length) {
-      highlightedSuggestionIndex = -1;
-      tagInput?.removeAttribute('aria-activedescendant');
-      return;
-    }
-    if (index < 0) {
-      index = options.length - 1;
-    } else if (index >= options.length) {
-      index = 0;
-    }
-    highlightedSuggestionIndex = index;
-    options.forEach((option, optionIndex) => {
-      option.classList.toggle('is-highlighted', optionIndex === highlightedSuggestionIndex);
-    });
-    const activeOption = options[highlightedSuggestionIndex];
-    if (activeOption) {
-      activeOption.scrollIntoView({ block: 'nearest' });
-      tagInput?.setAttribute('aria-activedescendant', activeOption.id);
-    } else {
-      tagInput?.removeAttribute('aria-activedescendant');
-    }
-  }
-
-  function findBestMatch(query) {
-    if (!query) return null;
-    const availableTags = getAvailableTags();
-    const lowerCaseQuery = query.toLowerCase();
-    return (
-      availableTags.find((tag) => tag.toLowerCase() === lowerCaseQuery) ||
-      availableTags.find((tag) => tag.toLowerCase().startsWith(lowerCaseQuery)) ||
-      availableTags.find((tag) => tag.toLowerCase().includes(lowerCaseQuery)) ||
-      null
-    );
-  }
-
-  function addTag(tag) {
-    if (!tag || activeTagSet.has(tag)) {
-      return;
-    }
-    activeTags.push(tag);
-    activeTagSet.add(tag);
-    renderSelectedTags();
-    filterEpisodes();
-    if (tagInput) {
-      tagInput.value = '';
-      tagInput.focus();
-    }
-    updateSuggestions();
-  }
-
-  function removeTag(tag) {
-    if (!activeTagSet.has(tag)) {
-      return;
-    }
-    activeTagSet.delete(tag);
-    const index = activeTags.indexOf(tag);
-    if (index !== -1) {
-      activeTags.splice(index, 1);
-    }
-    renderSelectedTags();
-    filterEpisodes();
-    updateSuggestions();
-  }
-
-  function handleTagInputKeydown(event) {
-    if (!tagInput) return;
-    if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
-      if (suggestionsList?.hidden) {
-        updateSuggestions();
-      }
-      const options = suggestionsList ? suggestionsList.querySelectorAll('.tag-suggestion') : [];
-      if (!options.length) {
-        return;
-      }
-      event.preventDefault();
-      const nextIndex =
-        event.key === 'ArrowDown'
-          ? highlightedSuggestionIndex + 1
-          : highlightedSuggestionIndex === -1
-          ? options.length - 1
-          : highlightedSuggestionIndex - 1;
-      highlightSuggestion(nextIndex);
-    } else if (
-      event.key === 'Enter' ||
-      event.key === ',' ||
-      (event.key === 'Tab' && tagInput.value.trim())
-    ) {
-      const options = suggestionsList ? suggestionsList.querySelectorAll('.tag-suggestion') : [];
-      const highlightedOption =
-        highlightedSuggestionIndex >= 0 && options[highlightedSuggestionIndex]
-          ? options[highlightedSuggestionIndex].textContent
-          : null;
-      const candidate = highlightedOption?.trim() || findBestMatch(tagInput.value.trim());
-      if (candidate) {
-        event.preventDefault();
-        addTag(candidate);
-      } else if (event.key === ',') {
-        event.preventDefault();
-      }
-    } else if (event.key === 'Backspace' && !tagInput.value && activeTags.length) {
-      event.preventDefault();
-      removeTag(activeTags[activeTags.length - 1]);
-    } else if (event.key === 'Escape') {
-      if (suggestionsList) {
-        suggestionsList.hidden = true;
-        suggestionsList.innerHTML = '';
-      }
-      highlightedSuggestionIndex = -1;
-      tagInput.setAttribute('aria-expanded', 'false');
-      tagInput.removeAttribute('aria-activedescendant');
-    }
-  }
-
-  function initializeTagSearch() {
-    if (!tagInput || !suggestionsList) return;
-    renderSelectedTags();
-    tagInput.addEventListener('input', () => {
-      highlightedSuggestionIndex = -1;
-      updateSuggestions();
-    });
-    tagInput.addEventListener('focus', () => {
-      highlightedSuggestionIndex = -1;
-      updateSuggestions();
-    });
-    tagInput.addEventListener('blur', () => {
-      setTimeout(() => {
-        if (suggestionsList) {
-          suggestionsList.hidden = true;
-          suggestionsList.innerHTML = '';
-        }
-        tagInput.setAttribute('aria-expanded', 'false');
-        highlightedSuggestionIndex = -1;
-        tagInput.removeAttribute('aria-activedescendant');
-      }, 120);
-    });
-    tagInput.addEventListener('keydown', handleTagInputKeydown);
-    suggestionsList.addEventListener('mousedown', (event) => {
-      event.preventDefault();
-    });
-    suggestionsList.addEventListener('click', (event) => {
-      const option = event.target.closest('.tag-suggestion');
-      if (!option) return;
-      addTag(option.textContent.trim());
-    });
-    selectedTagsContainer?.addEventListener('click', (event) => {
-      const chip = event.target.closest('.tag-chip');
-      if (!chip) return;
-      const tag = chip.getAttribute('data-tag');
-      if (tag) {
-        removeTag(tag);
-        tagInput.focus();
-      }
-    });
-  }
-
-  function initializeEpisodes() {
-    if (!episodesContainer) return;
-    episodesData.length = 0;
-    allKeywordsSet.clear();
-    const cards = episodesContainer.querySelectorAll('.episode-card');
-    cards.forEach((card) => {
-      const keywordList = card.dataset.keywords ? JSON.parse(card.dataset.keywords) : [];
-      episodesData.push({ element: card, keywords: keywordList });
-      keywordList.forEach((keyword) => allKeywordsSet.add(keyword));
-    });
-    keywordDataReady = allKeywordsSet.size > 0;
-    if (tagSearchWrapper) {
-      tagSearchWrapper.hidden = allKeywordsSet.size === 0;
-    }
-    setTagInputAvailability(keywordDataReady);
-    filterEpisodes();
-    updateSuggestions();
-  }
-
-  initializeTagSearch();
-  initializeEpisodes();
-})();
-""").strip("\n")
-    static_script = textwrap.indent(static_script, "      ")
-    result = re.sub(
-        r'(\s*<script>\s*const structuredDataEl[\s\S]*?</script>)',
-        '    <script>\n' + static_script + '\n    </script>',
-        result,
-        count=1
+    result = result.replace(_COPYRIGHT_PLACEHOLDER, f'© {now_year}', 1)
+    result = result.replace(
+        _STATIC_SCRIPT_MARKER, '    <script>\n' + static_script + '\n    </script>', 1
     )
 
     OUTPUT_PATH.write_text(result, encoding="utf-8")
+    _store_build_cache(digest)
 
 
 if __name__ == "__main__":
-    main()
+    main(force="--force" in sys.argv[1:])
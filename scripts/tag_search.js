@@ -0,0 +1,293 @@
+(() => {
+  const episodesContainer = document.getElementById('episodes');
+  const tagSearchWrapper = document.getElementById('tag-search');
+  const selectedTagsContainer = document.getElementById('selected-tags');
+  const tagInput = document.getElementById('tag-input');
+  const suggestionsList = document.getElementById('tag-suggestions');
+  const noResultsEl = document.getElementById('no-results');
+  const episodesData = [];
+  const allKeywordsSet = new Set();
+  const activeTags = [];
+  const activeTagSet = new Set();
+  let highlightedSuggestionIndex = -1;
+  const tagInputDefaultPlaceholder = tagInput?.getAttribute('placeholder') || '';
+  const TAG_INPUT_DISABLED_PLACEHOLDER = '目前沒有可用關鍵字';
+  const TAG_SUGGESTION_LIMIT = 100;
+  let keywordDataReady = false;
+
+  function getAvailableTags() {
+    return Array.from(allKeywordsSet).filter((tag) => !activeTagSet.has(tag));
+  }
+
+  function renderSelectedTags() {
+    if (!selectedTagsContainer) return;
+    selectedTagsContainer.innerHTML = '';
+    activeTags.forEach((tag) => {
+      const chip = document.createElement('button');
+      chip.type = 'button';
+      chip.className = 'tag-chip';
+      chip.setAttribute('data-tag', tag);
+      chip.setAttribute('aria-label', `移除關鍵字 ${tag}`);
+      chip.innerHTML = `<span>${tag}</span><span class="tag-chip-remove" aria-hidden="true">×</span>`;
+      selectedTagsContainer.appendChild(chip);
+    });
+  }
+
+  function filterEpisodes() {
+    if (!episodesContainer) return;
+    const hasActiveTags = activeTags.length > 0;
+    let visibleCount = 0;
+    episodesData.forEach(({ element, keywords }) => {
+      const matches = !hasActiveTags || keywords.some((keyword) => activeTagSet.has(keyword));
+      element.hidden = !matches;
+      if (matches) {
+        visibleCount += 1;
+      }
+    });
+    if (noResultsEl) {
+      if (!hasActiveTags) {
+        noResultsEl.hidden = true;
+      } else {
+        noResultsEl.hidden = visibleCount > 0;
+      }
+    }
+  }
+
+  function setTagInputAvailability(isReady) {
+    if (!tagInput) return;
+    if (isReady) {
+      tagInput.disabled = false;
+      tagInput.removeAttribute('aria-disabled');
+      if (tagInputDefaultPlaceholder) {
+        tagInput.setAttribute('placeholder', tagInputDefaultPlaceholder);
+      } else {
+        tagInput.removeAttribute('placeholder');
+      }
+    } else {
+      tagInput.disabled = true;
+      tagInput.setAttribute('aria-disabled', 'true');
+      tagInput.setAttribute('placeholder', TAG_INPUT_DISABLED_PLACEHOLDER);
+      tagInput.value = '';
+    }
+  }
+
+  function updateSuggestions() {
+    if (!tagInput || !suggestionsList) return;
+    if (!keywordDataReady) {
+      suggestionsList.hidden = true;
+      tagInput.setAttribute('aria-expanded', 'false');
+      highlightedSuggestionIndex = -1;
+      tagInput.removeAttribute('aria-activedescendant');
+      return;
+    }
+    suggestionsList.innerHTML = '';
+    highlightedSuggestionIndex = -1;
+    tagInput.removeAttribute('aria-activedescendant');
+    const availableTags = getAvailableTags();
+    if (!availableTags.length) {
+      suggestionsList.hidden = true;
+      tagInput.setAttribute('aria-expanded', 'false');
+      return;
+    }
+    const query = tagInput.value.trim().toLowerCase();
+    const matches = query
+      ? availableTags.filter((tag) => tag.toLowerCase().includes(query))
+      : availableTags;
+    const limited = matches.slice(0, TAG_SUGGESTION_LIMIT);
+    if (!limited.length || document.activeElement !== tagInput) {
+      suggestionsList.hidden = true;
+      tagInput.setAttribute('aria-expanded', 'false');
+      return;
+    }
+    limited.forEach((tag, index) => {
+      const option = document.createElement('li');
+      option.className = 'tag-suggestion';
+      option.id = `tag-suggestion-${index}`;
+      option.setAttribute('role', 'option');
+      option.textContent = tag;
+      suggestionsList.appendChild(option);
+    });
+    suggestionsList.hidden = false;
+    tagInput.setAttribute('aria-expanded', 'true');
+  }
+
+  function highlightSuggestion(index) {
+    if (!suggestionsList) return;
+    const options = Array.from(suggestionsList.querySelectorAll('.tag-suggestion'));
+    if (!options.length) {
+      highlightedSuggestionIndex = -1;
+      tagInput?.removeAttribute('aria-activedescendant');
+      return;
+    }
+    if (index < 0) {
+      index = options.length - 1;
+    } else if (index >= options.length) {
+      index = 0;
+    }
+    highlightedSuggestionIndex = index;
+    options.forEach((option, optionIndex) => {
+      option.classList.toggle('is-highlighted', optionIndex === highlightedSuggestionIndex);
+    });
+    const activeOption = options[highlightedSuggestionIndex];
+    if (activeOption) {
+      activeOption.scrollIntoView({ block: 'nearest' });
+      tagInput?.setAttribute('aria-activedescendant', activeOption.id);
+    } else {
+      tagInput?.removeAttribute('aria-activedescendant');
+    }
+  }
+
+  function findBestMatch(query) {
+    if (!query) return null;
+    const availableTags = getAvailableTags();
+    const lowerCaseQuery = query.toLowerCase();
+    return (
+      availableTags.find((tag) => tag.toLowerCase() === lowerCaseQuery) ||
+      availableTags.find((tag) => tag.toLowerCase().startsWith(lowerCaseQuery)) ||
+      availableTags.find((tag) => tag.toLowerCase().includes(lowerCaseQuery)) ||
+      null
+    );
+  }
+
+  function addTag(tag) {
+    if (!tag || activeTagSet.has(tag)) {
+      return;
+    }
+    activeTags.push(tag);
+    activeTagSet.add(tag);
+    renderSelectedTags();
+    filterEpisodes();
+    if (tagInput) {
+      tagInput.value = '';
+      tagInput.focus();
+    }
+    updateSuggestions();
+  }
+
+  function removeTag(tag) {
+    if (!activeTagSet.has(tag)) {
+      return;
+    }
+    activeTagSet.delete(tag);
+    const index = activeTags.indexOf(tag);
+    if (index !== -1) {
+      activeTags.splice(index, 1);
+    }
+    renderSelectedTags();
+    filterEpisodes();
+    updateSuggestions();
+  }
+
+  function handleTagInputKeydown(event) {
+    if (!tagInput) return;
+    if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
+      if (suggestionsList?.hidden) {
+        updateSuggestions();
+      }
+      const options = suggestionsList ? suggestionsList.querySelectorAll('.tag-suggestion') : [];
+      if (!options.length) {
+        return;
+      }
+      event.preventDefault();
+      const nextIndex =
+        event.key === 'ArrowDown'
+          ? highlightedSuggestionIndex + 1
+          : highlightedSuggestionIndex === -1
+          ? options.length - 1
+          : highlightedSuggestionIndex - 1;
+      highlightSuggestion(nextIndex);
+    } else if (
+      event.key === 'Enter' ||
+      event.key === ',' ||
+      (event.key === 'Tab' && tagInput.value.trim())
+    ) {
+      const options = suggestionsList ? suggestionsList.querySelectorAll('.tag-suggestion') : [];
+      const highlightedOption =
+        highlightedSuggestionIndex >= 0 && options[highlightedSuggestionIndex]
+          ? options[highlightedSuggestionIndex].textContent
+          : null;
+      const candidate = highlightedOption?.trim() || findBestMatch(tagInput.value.trim());
+      if (candidate) {
+        event.preventDefault();
+        addTag(candidate);
+      } else if (event.key === ',') {
+        event.preventDefault();
+      }
+    } else if (event.key === 'Backspace' && !tagInput.value && activeTags.length) {
+      event.preventDefault();
+      removeTag(activeTags[activeTags.length - 1]);
+    } else if (event.key === 'Escape') {
+      if (suggestionsList) {
+        suggestionsList.hidden = true;
+        suggestionsList.innerHTML = '';
+      }
+      highlightedSuggestionIndex = -1;
+      tagInput.setAttribute('aria-expanded', 'false');
+      tagInput.removeAttribute('aria-activedescendant');
+    }
+  }
+
+  function initializeTagSearch() {
+    if (!tagInput || !suggestionsList) return;
+    renderSelectedTags();
+    tagInput.addEventListener('input', () => {
+      highlightedSuggestionIndex = -1;
+      updateSuggestions();
+    });
+    tagInput.addEventListener('focus', () => {
+      highlightedSuggestionIndex = -1;
+      updateSuggestions();
+    });
+    tagInput.addEventListener('blur', () => {
+      setTimeout(() => {
+        if (suggestionsList) {
+          suggestionsList.hidden = true;
+          suggestionsList.innerHTML = '';
+        }
+        tagInput.setAttribute('aria-expanded', 'false');
+        highlightedSuggestionIndex = -1;
+        tagInput.removeAttribute('aria-activedescendant');
+      }, 120);
+    });
+    tagInput.addEventListener('keydown', handleTagInputKeydown);
+    suggestionsList.addEventListener('mousedown', (event) => {
+      event.preventDefault();
+    });
+    suggestionsList.addEventListener('click', (event) => {
+      const option = event.target.closest('.tag-suggestion');
+      if (!option) return;
+      addTag(option.textContent.trim());
+    });
+    selectedTagsContainer?.addEventListener('click', (event) => {
+      const chip = event.target.closest('.tag-chip');
+      if (!chip) return;
+      const tag = chip.getAttribute('data-tag');
+      if (tag) {
+        removeTag(tag);
+        tagInput.focus();
+      }
+    });
+  }
+
+  function initializeEpisodes() {
+    if (!episodesContainer) return;
+    episodesData.length = 0;
+    allKeywordsSet.clear();
+    const cards = episodesContainer.querySelectorAll('.episode-card');
+    cards.forEach((card) => {
+      const keywordList = card.dataset.keywords ? JSON.parse(card.dataset.keywords) : [];
+      episodesData.push({ element: card, keywords: keywordList });
+      keywordList.forEach((keyword) => allKeywordsSet.add(keyword));
+    });
+    keywordDataReady = allKeywordsSet.size > 0;
+    if (tagSearchWrapper) {
+      tagSearchWrapper.hidden = allKeywordsSet.size === 0;
+    }
+    setTagInputAvailability(keywordDataReady);
+    filterEpisodes();
+    updateSuggestions();
+  }
+
+  initializeTagSearch();
+  initializeEpisodes();
+})();